@@ -0,0 +1,110 @@
+#!/bin/bash
+set -e
+
+# Unit test for the FUSE mount's reply parsing (src/utils/ftp-fuse-mount.py)
+# Covers LIST lines, MLSD and MLST facts, and MDTM timestamps
+
+echo "🧪 Running FUSE parsing test..."
+
+if ! python3 -c "import fusepy" 2>/dev/null; then
+    echo "ℹ fusepy not installed - skipping FUSE parsing test"
+    exit 0
+fi
+
+python3 - <<'EOF'
+import ftplib
+import importlib.util
+
+spec = importlib.util.spec_from_file_location('ftp_fuse_mount', 'src/utils/ftp-fuse-mount.py')
+mount = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mount)
+
+ops = mount.FtpFuseOperations()
+
+
+def check(label, actual, expected):
+    if actual != expected:
+        raise SystemExit(f"{label}: expected {expected!r}, got {actual!r}")
+
+
+# MDTM/MLSD timestamps are UTC, with optional fractional seconds
+check("parse time", mount._parse_ftp_time('20241201120000'), 1733054400)
+check("parse time with fraction", mount._parse_ftp_time('20241201120000.123'), 1733054400)
+
+# Bundled server LIST: "\r\n"-joined lines, padded size, no trailing newline
+listing = b'\r\n'.join([
+    b'drwx 1 monk monk        0 Dec 01 12:00 users',
+    b'-rwx 1 monk monk     1234 Dec 01 12:00 user-1.json',
+    b'-rwx 1 monk monk      NaN Dec 01 12:00 broken size',
+])
+files = ops._ftp_list_to_files(listing)
+check("bundled LIST names", sorted(files), ['broken size', 'user-1.json', 'users'])
+check("bundled LIST dir", files['users']['is_dir'], True)
+check("bundled LIST size", files['user-1.json']['size'], 1234)
+check("non-numeric LIST size", files['broken size']['size'], 0)
+
+# Unix-style LIST with a summary line and a trailing newline
+listing = (b'total 8\n'
+           b'drwxr-xr-x 2 root root 4096 Jan  5  2024 data\n'
+           b'-rw-r--r-- 1 root root   12 Jan  5 10:30 notes.txt\n')
+files = ops._ftp_list_to_files(listing)
+check("unix LIST names", sorted(files), ['data', 'notes.txt'])
+check("unix LIST size", files['notes.txt']['size'], 12)
+
+# MLSD facts: cdir/pdir skipped, missing size is 0, modify parsed as UTC
+files = ops._mlsd_to_files([
+    ('.', {'type': 'cdir'}),
+    ('..', {'type': 'pdir'}),
+    ('users', {'type': 'dir', 'modify': '20241201120000'}),
+    ('email', {'type': 'file', 'size': '19', 'modify': '20241201120000'}),
+    ('odd', {'type': 'file'}),
+])
+check("MLSD names", sorted(files), ['email', 'odd', 'users'])
+check("MLSD dir", files['users']['is_dir'], True)
+check("MLSD size", files['email']['size'], 19)
+check("MLSD mtime", files['email']['mtime'], 1733054400)
+check("MLSD missing size", files['odd']['size'], 0)
+
+
+class FakeFtp:
+    """Control connection answering MLST and CWD from a table of paths"""
+
+    def __init__(self, paths):
+        self.paths = paths
+        self.cwds = []
+
+    def sendcmd(self, cmd):
+        path = cmd.split(' ', 1)[1]
+        if path not in self.paths:
+            raise ftplib.error_perm('550 No such file or directory')
+        return f'250-Listing {path}\n {self.paths[path]} {path}\n250 End'
+
+    def cwd(self, path):
+        self.cwds.append(path)
+        if path != '/' and not self.paths.get(path, '').startswith('type=dir'):
+            raise ftplib.error_perm('550 Not a directory')
+
+
+ftp = FakeFtp({
+    '/data': 'type=dir;modify=20241201120000;',
+    '/data/email': 'type=file;size=19;modify=20241201120000;',
+})
+
+# MLST facts when the server advertises it
+ops._server_feats = {'MLST'}
+attrs = ops._probe_path(ftp, '/data')
+check("MLST dir mode", attrs['st_mode'], mount.DIR_MODE)
+check("MLST dir mtime", attrs['st_mtime'], 1733054400)
+attrs = ops._probe_path(ftp, '/data/email')
+check("MLST file mode", attrs['st_mode'], mount.FILE_MODE)
+check("MLST file size", attrs['st_size'], 19)
+check("MLST missing", ops._probe_path(ftp, '/nope'), None)
+
+# CWD there and back otherwise
+ops._server_feats = set()
+check("CWD dir mode", ops._probe_path(ftp, '/data')['st_mode'], mount.DIR_MODE)
+check("CWD returns to root", ftp.cwds, ['/data', '/'])
+check("CWD missing", ops._probe_path(ftp, '/nope'), None)
+EOF
+
+echo "✅ FUSE parsing test passed"
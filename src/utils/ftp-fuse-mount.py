@@ -9,7 +9,7 @@ Requirements:
     pip install fusepy
 
 Usage:
-    python3 src/utils/ftp-fuse-mount.py /mnt/monk-api
+    python3 src/utils/ftp-fuse-mount.py /mnt/monk-api [--attr-timeout 5] [--entry-timeout 5] [--negative-timeout 1] [--max-conns 4] [--prefetch-workers 4] [--tls]
     ls /mnt/monk-api/data/users/
     cat /mnt/monk-api/data/users/user-123.../email
     echo "new content" > /mnt/monk-api/data/users/user-123.../name
@@ -17,12 +17,24 @@ Usage:
 """
 
 import os
+import re
 import sys
+import argparse
 import stat
 import errno
+import ssl
+import socket
+import posixpath
+import time
+import calendar
+import queue
 import ftplib
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+import itertools
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     from fusepy import FUSE, FuseOSError, Operations
@@ -31,89 +43,689 @@ except ImportError:
     sys.exit(1)
 
 
+# Pooled connections idle longer than this are probed with NOOP before reuse
+POOL_IDLE_PROBE_SECONDS = 30.0
+
+# st_mode values reported for directories and regular files
+DIR_MODE = stat.S_IFDIR | 0o755
+FILE_MODE = stat.S_IFREG | 0o644
+
+# Root directory attributes, timestamped at mount time. getattr results are
+# shared with the caches and FUSE, so callers must treat them as read-only.
+_mount_ts = int(time.time())
+ROOT_ATTRS = {
+    'st_mode': DIR_MODE,
+    'st_nlink': 2,
+    'st_size': 0,
+    'st_ctime': _mount_ts,
+    'st_mtime': _mount_ts,
+    'st_atime': _mount_ts
+}
+
+# Common desktop environment probes, answered ENOENT without asking the server
+DESKTOP_PROBES = frozenset([
+    '/.Trash', '/.Trash-1000', '/.xdg-volume-info', '/autorun.inf',
+    '/.directory', '/.DS_Store', '/Thumbs.db', '/desktop.ini'
+])
+
+# Reply codes meaning the server does not implement a command
+UNSUPPORTED_COMMAND_CODES = ('500', '502', '504')
+
+# Reply codes servers use to reject a path that does not exist
+MISSING_PATH_CODES = ('501', '550')
+
+# One LIST line: perms, links, owner, group, size, 3-field date, name.
+# Fields are not validated; a non-numeric size is reported as 0
+LIST_LINE_RE = re.compile(
+    rb'^(\S+)[ \t]+\S+[ \t]+\S+[ \t]+\S+[ \t]+(\S+)[ \t]+\S+[ \t]+\S+[ \t]+\S+[ \t]+(.+?)\r?$',
+    re.MULTILINE
+)
+
+# MLSD facts needed to build stat results without per-file queries
+MLSD_FACTS = ['type', 'size', 'modify', 'perm']
+
+# Default block size for transfers, well above ftplib's 8K default
+TRANSFER_BLOCKSIZE = 131072
+
+# Kernel send/receive buffer size for control and data sockets
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Shared per-path state is guarded by one of this many sharded locks
+PATH_LOCK_SHARDS = 16
+
+# Open RETR transfers kept alive for sequential reads (each pins a connection)
+MAX_READ_STREAMS = 8
+
+# Readahead window per open transfer, in transfer blocks
+READAHEAD_BLOCKS = 4
+
+
+def _parse_ftp_time(value: str) -> int:
+    """Convert an MDTM/MLSD YYYYMMDDHHMMSS[.sss] UTC timestamp to epoch seconds"""
+    return calendar.timegm((int(value[0:4]), int(value[4:6]), int(value[6:8]),
+                            int(value[8:10]), int(value[10:12]), int(value[12:14]),
+                            0, 0, 0))
+
+
+def _set_socket_buffers(sock: socket.socket):
+    """Enlarge kernel socket buffers so large transfers need fewer syscalls"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+
+
+class _TunedFTP(ftplib.FTP):
+    """ftplib.FTP whose data connections use enlarged socket buffers"""
+    
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        _set_socket_buffers(conn)
+        return conn, size
+
+
+class _TunedFTPTLS(ftplib.FTP_TLS):
+    """ftplib.FTP_TLS that resumes TLS sessions instead of full handshakes"""
+    
+    # Session from an earlier control connection to resume on AUTH
+    tls_session: Optional[ssl.SSLSession] = None
+    
+    def auth(self):
+        resp = self.voidcmd('AUTH TLS')
+        self.sock = self.context.wrap_socket(self.sock, server_hostname=self.host,
+                                             session=self.tls_session)
+        self.file = self.sock.makefile(mode='r', encoding=self.encoding)
+        return resp
+    
+    def ntransfercmd(self, cmd, rest=None):
+        # Skip FTP_TLS.ntransfercmd so data channels resume the control session
+        conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
+        _set_socket_buffers(conn)
+        if self._prot_p:
+            conn = self.context.wrap_socket(conn, server_hostname=self.host,
+                                            session=self.sock.session)
+        return conn, size
+
+
+class _TTLCache:
+    """Bounded LRU of per-path values that expire after a TTL"""
+    
+    def __init__(self, max_entries: int = 1024, ttl: float = 5.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, path: str):
+        """Return the cached value for path, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[path]
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+    
+    def put(self, path: str, value):
+        """Cache value for path, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[sys.intern(path)] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def pop(self, path: str, default=None):
+        """Drop path from the cache"""
+        with self._lock:
+            entry = self._entries.pop(path, None)
+        return default if entry is None else entry[1]
+
+
+class _Readahead:
+    """Background RETR that keeps a bounded window of file data around the
+    read cursor: up to window bytes ahead of it, and up to window bytes
+    already consumed behind it for reads that arrive out of order"""
+    
+    def __init__(self, owner: 'FtpFuseOperations', path: str, offset: int, window: int):
+        self.offset = offset  # read cursor: end of the furthest read so far
+        self.eof = False
+        self.error: Optional[BaseException] = None
+        self._owner = owner
+        self._path = path
+        self._start_offset = offset
+        self._window = window
+        self._blocks: deque = deque()
+        self._base = offset  # file offset of the first byte in _blocks
+        self._end = offset  # file offset just past the last byte in _blocks
+        self._discard = 0  # incoming bytes to throw away before buffering
+        self._waiting: List[int] = []  # offsets of readers waiting for data
+        self._closed = False
+        self._sock = None
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, name=f'ftp-readahead {path}', daemon=True).start()
+    
+    def _run(self):
+        """Fill the window from the data connection until EOF or close"""
+        try:
+            ftp, sock, position = self._owner._start_retr(self._path, self._start_offset)
+        except BaseException as e:
+            with self._cond:
+                self.error = e
+                self._cond.notify_all()
+            return
+        
+        with self._cond:
+            self._sock = sock
+            # Server could not honour REST - skip up to the requested offset
+            self._discard += self._start_offset - position
+        
+        try:
+            while True:
+                with self._cond:
+                    while not self._closed and self._end - self.offset >= self._window:
+                        self._cond.wait()
+                    if self._closed:
+                        break
+                
+                chunk = sock.recv(self._owner._blocksize)
+                
+                with self._cond:
+                    if self._closed:
+                        break
+                    if not chunk:
+                        self.eof = True
+                        self._cond.notify_all()
+                        break
+                    if self._discard:
+                        skipped = min(self._discard, len(chunk))
+                        self._discard -= skipped
+                        chunk = chunk[skipped:]
+                    if chunk:
+                        self._blocks.append(chunk)
+                        self._end += len(chunk)
+                        self._trim()
+                    self._cond.notify_all()
+        except Exception as e:
+            with self._cond:
+                self.error = e
+                self._cond.notify_all()
+        
+        sock.close()
+        if not self.eof:
+            # Aborted mid-transfer - the reply sequence is unpredictable
+            self._owner._close_connection(ftp)
+            return
+        try:
+            ftp.voidresp()
+        except Exception:
+            self._owner._close_connection(ftp)
+        else:
+            self._owner._release(ftp)
+    
+    def _trim(self):
+        """Drop blocks that lie entirely more than a window behind the cursor,
+        keeping anything a waiting reader still needs"""
+        keep_from = self.offset - self._window
+        if self._waiting:
+            keep_from = min(keep_from, min(self._waiting))
+        while self._blocks and self._base + len(self._blocks[0]) <= keep_from:
+            self._base += len(self._blocks.popleft())
+    
+    def read(self, offset: int, size: int, max_skip: float) -> Optional[bytes]:
+        """Return size bytes at offset, or None if offset is outside the stream"""
+        with self._cond:
+            if self._closed or offset < self._base:
+                return None
+            if offset - self._end > max_skip:
+                return None
+            
+            self._waiting.append(offset)
+            try:
+                # Reads past the cursor move it, letting the transfer run ahead;
+                # reads behind it are served from the consumed data still kept
+                if offset + size > self.offset:
+                    self.offset = offset + size
+                    self._trim()
+                    self._cond.notify_all()
+                
+                while self._end < offset + size and not self.eof and self.error is None and not self._closed:
+                    self._cond.wait()
+            finally:
+                self._waiting.remove(offset)
+            if self._closed:
+                return None
+            if self.error is not None and self._end < offset + size:
+                raise self.error
+            
+            # Skip whole blocks before offset, then copy the range out once
+            start = offset - self._base
+            wanted = min(size, self._end - offset)
+            pieces = []
+            for block in self._blocks:
+                if wanted <= 0:
+                    break
+                if start >= len(block):
+                    start -= len(block)
+                    continue
+                if not pieces and len(block) - start >= wanted:
+                    # Usual case: the whole read lies inside one block
+                    return block[start:start + wanted]
+                piece = memoryview(block)[start:start + wanted]
+                pieces.append(piece)
+                wanted -= len(piece)
+                start = 0
+            return b''.join(pieces)
+    
+    def close(self):
+        """Stop the transfer; the reader thread gives up its connection"""
+        with self._cond:
+            self._closed = True
+            self._blocks.clear()
+            self._cond.notify_all()
+            if self._sock is not None and not self.eof:
+                try:
+                    self._sock.shutdown(socket.SHUT_RDWR)  # unblock recv()
+                except OSError:
+                    pass
+
+
 class FtpFuseOperations(Operations):
     """FUSE filesystem operations using FTP protocol"""
     
-    def __init__(self, ftp_host='localhost', ftp_port=2121, ftp_user='root', ftp_pass='fake.jwt.token'):
+    def __init__(self, ftp_host='localhost', ftp_port=2121, ftp_user='root', ftp_pass='fake.jwt.token',
+                 pool_size=4, attr_ttl=5.0, negative_ttl=1.0, dir_ttl=5.0, dir_cache_size=1024,
+                 attr_cache_size=65536,
+                 blocksize=TRANSFER_BLOCKSIZE, prefetch_workers=0, use_tls=False):
         self.ftp_host = ftp_host
         self.ftp_port = ftp_port
         self.ftp_user = ftp_user
         self.ftp_pass = ftp_pass
         self._ftp_cache: Dict[str, any] = {}
-        self._dir_cache: Dict[str, List[str]] = {}
+        self._blocksize = blocksize
+        
+        # FTPS session resumed by new connections; FEAT asked once per mount
+        self.use_tls = use_tls
+        self._tls_session: Optional[ssl.SSLSession] = None
+        self._tls_context: Optional[ssl.SSLContext] = None
+        if use_tls:
+            # Sessions only resume within one context; same unverified
+            # defaults as ftplib.FTP_TLS
+            self._tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            self._tls_context.check_hostname = False
+            self._tls_context.verify_mode = ssl.CERT_NONE
+        self._server_feats: Optional[Set[str]] = None
+        
+        # Directory listings as path -> (readdir names, frozenset of entry names)
+        self._dir_cache = _TTLCache(max_entries=dir_cache_size, ttl=dir_ttl)
+        
+        # getattr results as path -> attrs, and paths known to be missing
+        self._attr_cache = _TTLCache(max_entries=attr_cache_size, ttl=attr_ttl)
+        self._neg_cache = _TTLCache(max_entries=attr_cache_size, ttl=negative_ttl)
+        
+        # Directory listings in progress, so sibling getattr calls share one MLSD
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Optional MDTM fan-out for servers whose LIST carries no usable mtime
+        self._prefetch: Optional[ThreadPoolExecutor] = None
+        if prefetch_workers:
+            self._prefetch = ThreadPoolExecutor(max_workers=prefetch_workers,
+                                                thread_name_prefix='ftp-prefetch')
+        
+        # MDTM results as path -> (size, mtime), reused by re-lists between
+        # readdirs while the size is unchanged; expire like other attributes
+        self._mtime_cache = _TTLCache(max_entries=attr_cache_size, ttl=attr_ttl)
+        
+        # Idle authenticated connections as (ftp, last_used) pairs; at most
+        # pool_size connections are borrowed for stateless operations at once
+        self._pool: queue.Queue = queue.Queue(maxsize=pool_size)
+        self._conn_slots = threading.BoundedSemaphore(pool_size)
+        
+        # Live RETR transfers keyed by (path, fh), least recently used first.
+        # Each stream pins its own connection outside the pool.
+        self._read_streams: 'OrderedDict[Tuple[str, int], _Readahead]' = OrderedDict()
+        self._ra_window = READAHEAD_BLOCKS * blocksize
+        self._streams_lock = threading.Lock()
+        self._rest_supported = True
+        self._mlsd_supported = True
+        self._next_fh = itertools.count(1)
+        
+        # Write-back buffers: whole file contents uploaded once on flush/release
+        self._wbuf: Dict[str, bytearray] = {}
+        self._wbuf_dirty = set()
+        self._wbuf_refs: Dict[str, int] = {}
+        self._write_fhs: Dict[int, str] = {}
+        self._path_locks = [threading.Condition(threading.RLock())
+                            for _ in range(PATH_LOCK_SHARDS)]
+        
+        # Paths whose buffer is being sent by STOR; nothing may resize it meanwhile
+        self._wbuf_uploading: Set[str] = set()
         
     def _get_ftp_connection(self) -> ftplib.FTP:
         """Create authenticated FTP connection"""
         try:
-            ftp = ftplib.FTP()
+            if self.use_tls:
+                ftp = _TunedFTPTLS(context=self._tls_context)
+                ftp.tls_session = self._tls_session
+            else:
+                ftp = _TunedFTP()
             ftp.connect(self.ftp_host, self.ftp_port)
+            _set_socket_buffers(ftp.sock)
             ftp.login(self.ftp_user, self.ftp_pass)
+            
+            if self.use_tls:
+                ftp.prot_p()
+                self._tls_session = ftp.sock.session
+            
+            if self._server_feats is None:
+                self._server_feats = self._query_feats(ftp)
             return ftp
         except Exception as e:
             print(f"FTP connection failed: {e}")
             raise FuseOSError(errno.ECONNREFUSED)
     
-    def _ftp_list_to_files(self, ftp_listing: List[str]) -> Dict[str, Dict]:
-        """Parse FTP LIST output to file information"""
+    def _query_feats(self, ftp: ftplib.FTP) -> Set[str]:
+        """Ask the server for its FEAT list and rule out unadvertised extensions"""
+        try:
+            resp = ftp.sendcmd('FEAT')
+        except ftplib.error_perm:
+            return set()  # FEAT itself unsupported - keep probing commands
+        
+        # Multi-line 211 reply: one feature per indented line
+        feats = {line.strip().split(' ', 1)[0].upper()
+                 for line in resp.splitlines()[1:-1] if line.strip()}
+        
+        # RFC 3659 servers advertise MLST when they implement MLSD
+        if 'MLST' not in feats:
+            self._mlsd_supported = False
+        return feats
+    
+    def _close_connection(self, ftp: ftplib.FTP):
+        """Close FTP connection, ignoring errors from dead sockets"""
+        try:
+            ftp.quit()
+        except Exception:
+            ftp.close()
+    
+    def _acquire(self) -> ftplib.FTP:
+        """Take a live connection from the pool, or open a new one"""
+        while True:
+            try:
+                ftp, last_used = self._pool.get_nowait()
+            except queue.Empty:
+                return self._get_ftp_connection()
+            
+            if time.monotonic() - last_used < POOL_IDLE_PROBE_SECONDS:
+                return ftp
+            
+            # Idle too long - the server may have dropped us
+            try:
+                ftp.voidcmd('NOOP')
+                return ftp
+            except Exception:
+                ftp.close()
+    
+    def _release(self, ftp: ftplib.FTP):
+        """Return connection to the pool, closing it if the pool is full"""
+        try:
+            self._pool.put_nowait((ftp, time.monotonic()))
+        except queue.Full:
+            self._close_connection(ftp)
+    
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection for the duration of one operation"""
+        with self._conn_slots:
+            ftp = self._acquire()
+            try:
+                yield ftp
+            except (ftplib.error_perm, FuseOSError):
+                # Server rejected the command - control channel is still in sync
+                self._release(ftp)
+                raise
+            except BaseException:
+                self._close_connection(ftp)
+                raise
+            else:
+                self._release(ftp)
+    
+    def _path_lock(self, path: str) -> threading.Condition:
+        """Lock guarding write buffer state for path, notified when uploads finish"""
+        return self._path_locks[hash(path) & (PATH_LOCK_SHARDS - 1)]
+    
+    def _wait_for_upload(self, path: str):
+        """Block until no STOR is sending path's buffer; caller holds its path lock"""
+        lock = self._path_lock(path)
+        while path in self._wbuf_uploading:
+            lock.wait()
+    
+    def _invalidate(self, path: str):
+        """Forget cached metadata for path and its parent directory"""
+        parent = posixpath.dirname(path)
+        self._dir_cache.pop(parent, None)
+        self._mtime_cache.pop(path, None)
+        for key in (path, parent):
+            self._attr_cache.pop(key, None)
+            self._neg_cache.pop(key, None)
+    
+    def _cache_listing(self, path: str, files: Dict[str, Dict]):
+        """Prime the attribute cache from a parsed directory listing"""
+        for name, info in files.items():
+            child = posixpath.join(path, name)
+            self._attr_cache.put(child, {
+                'st_mode': DIR_MODE if info['is_dir'] else FILE_MODE,
+                'st_nlink': info['nlink'],
+                'st_size': info['size'],
+                'st_ctime': info['ctime'],
+                'st_mtime': info['mtime'],
+                'st_atime': info['atime']
+            })
+            self._neg_cache.pop(child, None)
+    
+    def _ftp_list_to_files(self, ftp_listing: bytes) -> Dict[str, Dict]:
+        """Parse raw FTP LIST output to file information"""
         files = {}
+        now_ts = int(time.time())  # LIST dates are not parsed
         
-        for line in ftp_listing:
-            if not line.strip():
-                continue
-                
-            # Parse FTP LIST format: drwx 1 owner group size date time name
-            parts = line.split(None, 8)
-            if len(parts) < 9:
-                continue
-                
-            permissions = parts[0]
-            size = int(parts[4]) if parts[4].isdigit() else 0
-            name = parts[8]
+        # Parse FTP LIST format: drwx 1 owner group size date time name
+        # Lines that do not match (e.g. "total 12") are skipped
+        for match in LIST_LINE_RE.finditer(ftp_listing):
+            permissions, size, name = match.groups()
             
             # Determine file type
-            is_dir = permissions.startswith('d')
+            is_dir = permissions.startswith(b'd')
+            
+            files[name.decode('utf-8', 'replace')] = {
+                'is_dir': is_dir,
+                'size': int(size) if size.isdigit() else 0,
+                'permissions': permissions.decode('ascii', 'replace'),
+                'mode': stat.S_IFDIR if is_dir else stat.S_IFREG,
+                'nlink': 2 if is_dir else 1,
+                'mtime': now_ts,
+                'ctime': now_ts,
+                'atime': now_ts
+            }
+            
+        return files
+    
+    def _retrieve(self, ftp: ftplib.FTP, cmd: str) -> bytearray:
+        """Run a transfer command and collect the whole response in one buffer"""
+        ftp.voidcmd('TYPE I')
+        data = bytearray()
+        with ftp.transfercmd(cmd) as conn:
+            while True:
+                chunk = conn.recv(self._blocksize)
+                if not chunk:
+                    break
+                data += chunk
+            if isinstance(conn, ssl.SSLSocket):
+                conn.unwrap()
+        ftp.voidresp()
+        return data
+    
+    def _store(self, ftp: ftplib.FTP, cmd: str, data: bytearray):
+        """Run a transfer command and send the whole buffer without copying it"""
+        ftp.voidcmd('TYPE I')
+        with ftp.transfercmd(cmd) as conn, memoryview(data) as view:
+            conn.sendall(view)
+            if isinstance(conn, ssl.SSLSocket):
+                conn.unwrap()
+        ftp.voidresp()
+    
+    def _mlsd_to_files(self, entries) -> Dict[str, Dict]:
+        """Parse MLSD (name, facts) entries to file information"""
+        files = {}
+        now_ts = int(time.time())  # for entries without a modify fact
+        
+        for name, facts in entries:
+            entry_type = facts.get('type', '').lower()
+            if entry_type in ('cdir', 'pdir'):
+                continue  # readdir adds '.' and '..' itself
+            
+            is_dir = entry_type == 'dir'
+            size = facts.get('size', '0')
+            modify = facts.get('modify')
+            if modify:
+                mtime = _parse_ftp_time(modify)
+            else:
+                mtime = now_ts
             
             files[name] = {
                 'is_dir': is_dir,
-                'size': size,
-                'permissions': permissions,
+                'size': int(size) if size.isdigit() else 0,
+                'permissions': facts.get('perm', ''),
                 'mode': stat.S_IFDIR if is_dir else stat.S_IFREG,
                 'nlink': 2 if is_dir else 1,
-                'mtime': int(datetime.now().timestamp()),  # Could parse from FTP response
-                'ctime': int(datetime.now().timestamp()),
-                'atime': int(datetime.now().timestamp())
+                'mtime': mtime,
+                'ctime': mtime,
+                'atime': mtime
             }
             
         return files
     
+    def _list_directory(self, ftp: ftplib.FTP, path: str) -> Dict[str, Dict]:
+        """Fetch and parse a directory listing, preferring MLSD over LIST"""
+        if self._mlsd_supported:
+            try:
+                return self._mlsd_to_files(list(ftp.mlsd(path, facts=MLSD_FACTS)))
+            except ftplib.error_perm as e:
+                if str(e)[:3] not in UNSUPPORTED_COMMAND_CODES:
+                    raise
+                self._mlsd_supported = False
+        
+        # Absolute path instead of CWD keeps pooled connections interchangeable
+        return self._ftp_list_to_files(self._retrieve(ftp, f'LIST {path}'))
+    
+    def _query_mtime(self, path: str) -> Optional[int]:
+        """MDTM a single file on its own pooled connection"""
+        try:
+            with self._conn() as ftp:
+                mdtm_resp = ftp.sendcmd(f'MDTM {path}')
+            if not mdtm_resp.startswith('213'):
+                return None
+            return _parse_ftp_time(mdtm_resp.split()[1])
+        except Exception:
+            return None
+    
+    def _prefetch_mtimes(self, path: str, files: Dict[str, Dict], fetch: bool):
+        """Replace placeholder LIST mtimes with MDTM results, fetched in
+        parallel if fetch is set and otherwise taken from unexpired earlier ones"""
+        names = [name for name, info in files.items() if not info['is_dir']]
+        children = [posixpath.join(path, name) for name in names]
+        
+        if fetch:
+            mtimes = self._prefetch.map(self._query_mtime, children)
+        else:
+            mtimes = []
+            for name, child in zip(names, children):
+                known = self._mtime_cache.get(child)
+                same_size = known is not None and known[0] == files[name]['size']
+                mtimes.append(known[1] if same_size else None)
+        
+        for name, child, mtime in zip(names, children, mtimes):
+            if mtime is not None:
+                info = files[name]
+                info['mtime'] = info['ctime'] = info['atime'] = mtime
+                if fetch:
+                    self._mtime_cache.put(child, (info['size'], mtime))
+    
+    def _load_listing(self, path: str, prefetch: bool = False) -> List[str]:
+        """List directory and cache both its names and child attributes
+        
+        MDTM lookups for LIST-only servers are made only when prefetch is set,
+        so lookups that merely re-list a parent stay one round trip.
+        """
+        with self._conn() as ftp:
+            files = self._list_directory(ftp, path)
+        
+        # MLSD already carries real mtimes; LIST needs a round trip per file
+        if self._prefetch is not None and not self._mlsd_supported:
+            self._prefetch_mtimes(path, files, fetch=prefetch)
+        
+        file_names = ['.', '..'] + list(files.keys())
+        
+        # Cache results; the set answers name lookups without scanning the list
+        self._dir_cache.put(path, (file_names, frozenset(files)))
+        self._cache_listing(path, files)
+        
+        return file_names
+    
+    def _refresh_listing(self, path: str) -> bool:
+        """Re-list directory once, sharing the result with concurrent callers"""
+        with self._inflight_lock:
+            event = self._inflight.get(path)
+            leader = event is None
+            if leader:
+                event = self._inflight[path] = threading.Event()
+        
+        if not leader:
+            event.wait()
+            return self._dir_cache.get(path) is not None
+        
+        try:
+            self._load_listing(path)
+            return True
+        except Exception:
+            return False
+        finally:
+            with self._inflight_lock:
+                del self._inflight[path]
+            event.set()
+    
+    def _lookup_in_parent(self, path: str) -> Optional[Dict]:
+        """Answer getattr from a fresh listing of a recently listed parent"""
+        parent = posixpath.dirname(path)
+        listing = None if path == '/' else self._dir_cache.get(parent)
+        if listing is None:
+            return None
+        
+        # Names missing from an unexpired listing do not exist; only known
+        # entries whose attributes expired are worth a re-list
+        if posixpath.basename(path) not in listing[1]:
+            raise FuseOSError(errno.ENOENT)
+        
+        if not self._refresh_listing(parent):
+            return None
+        
+        listing = self._dir_cache.get(parent)
+        if listing is not None and posixpath.basename(path) not in listing[1]:
+            # Listing succeeded but did not include this entry
+            raise FuseOSError(errno.ENOENT)
+        
+        # None if the bounded cache already evicted it - caller stats directly
+        return self._attr_cache.get(path)
+    
     def readdir(self, path: str, fh=None) -> List[str]:
         """List directory contents"""
         try:
-            if path in self._dir_cache:
-                return self._dir_cache[path]
+            cached = self._dir_cache.get(path)
+            if cached is not None:
+                return cached[0]
                 
-            ftp = self._get_ftp_connection()
-            
-            # Change to directory
-            if path != '/':
-                ftp.cwd(path)
-            
-            # Get directory listing
-            listing = []
-            ftp.retrlines('LIST', listing.append)
-            ftp.quit()
-            
-            # Parse listing
-            files = self._ftp_list_to_files(listing)
-            file_names = ['.', '..'] + list(files.keys())
-            
-            # Cache results
-            self._dir_cache[path] = file_names
-            
-            return file_names
+            return self._load_listing(path, prefetch=True)
             
         except ftplib.error_perm as e:
-            if '550' in str(e):  # File not found
+            if str(e)[:3] in MISSING_PATH_CODES:  # File not found
                 raise FuseOSError(errno.ENOENT)
             elif '530' in str(e):  # Not logged in / permission denied
                 raise FuseOSError(errno.EACCES)
@@ -125,32 +737,60 @@ class FtpFuseOperations(Operations):
     
     def getattr(self, path: str, fh=None) -> Dict:
         """Get file/directory attributes"""
+        # FUSE hands us a fresh string per call; interning makes every cache
+        # probe below hit the stored key by identity
+        path = sys.intern(path)
+        
         # Suppress common desktop environment probes to reduce log noise
-        desktop_probes = [
-            '/.Trash', '/.Trash-1000', '/.xdg-volume-info', '/autorun.inf',
-            '/.directory', '/.DS_Store', '/Thumbs.db', '/desktop.ini'
-        ]
-        if path in desktop_probes:
+        if path in DESKTOP_PROBES:
+            raise FuseOSError(errno.ENOENT)
+        
+        buf = self._wbuf.get(path)
+        if buf is not None:
+            # File is open for writing - report the buffered size
+            mtime = int(time.time())
+            return {
+                'st_mode': FILE_MODE,
+                'st_nlink': 1,
+                'st_size': len(buf),
+                'st_ctime': mtime,
+                'st_mtime': mtime,
+                'st_atime': mtime
+            }
+        
+        cached = self._attr_cache.get(path)
+        if cached is not None:
+            return cached
+        
+        if self._neg_cache.get(path) is not None:
             raise FuseOSError(errno.ENOENT)
         
+        try:
+            attrs = self._lookup_in_parent(path)
+            if attrs is None:
+                attrs = self._fetch_attr(path)
+        except FuseOSError as e:
+            if e.errno == errno.ENOENT:
+                self._neg_cache.put(path, True)
+            raise
+        
+        self._attr_cache.put(path, attrs)
+        return attrs
+    
+    def _fetch_attr(self, path: str) -> Dict:
+        """Query file/directory attributes from the FTP server"""
         try:
             if path == '/':
                 # Root directory
-                return {
-                    'st_mode': stat.S_IFDIR | 0o755,
-                    'st_nlink': 2,
-                    'st_size': 0,
-                    'st_ctime': int(datetime.now().timestamp()),
-                    'st_mtime': int(datetime.now().timestamp()),
-                    'st_atime': int(datetime.now().timestamp())
-                }
-            
-            # Use FTP STAT command for file information
-            ftp = self._get_ftp_connection()
+                return ROOT_ATTRS
             
-            # Try SIZE first - if it works, it's likely a file
-            try:
-                size_resp = ftp.sendcmd(f'SIZE {path}')
+            with self._conn() as ftp:
+                # Try SIZE first - if it works, it's likely a file
+                try:
+                    size_resp = ftp.sendcmd(f'SIZE {path}')
+                except ftplib.Error:
+                    size_resp = ''
+                
                 if size_resp.startswith('213'):
                     file_size = int(size_resp.split()[1])
                     
@@ -158,54 +798,32 @@ class FtpFuseOperations(Operations):
                     try:
                         mdtm_resp = ftp.sendcmd(f'MDTM {path}')
                         if mdtm_resp.startswith('213'):
-                            timestamp_str = mdtm_resp.split()[1]
-                            dt = datetime.strptime(timestamp_str, '%Y%m%d%H%M%S')
-                            mtime = int(dt.timestamp())
+                            mtime = _parse_ftp_time(mdtm_resp.split()[1])
                         else:
-                            mtime = int(datetime.now().timestamp())
+                            mtime = int(time.time())
                     except:
-                        mtime = int(datetime.now().timestamp())
-                    
-                    ftp.quit()
+                        mtime = int(time.time())
                     
                     # It's a file
                     return {
-                        'st_mode': stat.S_IFREG | 0o644,
+                        'st_mode': FILE_MODE,
                         'st_nlink': 1,
                         'st_size': file_size,
                         'st_ctime': mtime,
                         'st_mtime': mtime,
                         'st_atime': mtime
                     }
-                else:
-                    raise Exception("SIZE command failed")
-                    
-            except:
+                
                 # SIZE failed - might be a directory
-                try:
-                    current_dir = ftp.pwd()
-                    ftp.cwd(path)  # Try to change to directory
-                    ftp.cwd(current_dir)  # Change back to original directory
-                    
-                    ftp.quit()
-                    
-                    # It's a directory
-                    return {
-                        'st_mode': stat.S_IFDIR | 0o755,
-                        'st_nlink': 2,
-                        'st_size': 0,
-                        'st_ctime': int(datetime.now().timestamp()),
-                        'st_mtime': int(datetime.now().timestamp()),
-                        'st_atime': int(datetime.now().timestamp())
-                    }
-                    
-                except:
-                    ftp.quit()
-                    # Neither file nor directory - not found
-                    raise FuseOSError(errno.ENOENT)
+                attrs = self._probe_path(ftp, path)
+            
+            if attrs is None:
+                # Neither file nor directory - not found
+                raise FuseOSError(errno.ENOENT)
+            return attrs
             
         except ftplib.error_perm as e:
-            if '550' in str(e):
+            if str(e)[:3] in MISSING_PATH_CODES:
                 raise FuseOSError(errno.ENOENT)
             elif '530' in str(e):
                 raise FuseOSError(errno.EACCES)
@@ -215,22 +833,217 @@ class FtpFuseOperations(Operations):
             print(f"getattr error for {path}: {e}")
             raise FuseOSError(errno.ENOENT)
     
-    def read(self, path: str, size: int, offset: int, fh=None) -> bytes:
-        """Read file content"""
+    def _probe_path(self, ftp: ftplib.FTP, path: str) -> Optional[Dict]:
+        """Stat a path SIZE could not answer with one absolute-path command,
+        MLST if advertised, otherwise CWD there and back. None if missing"""
+        if self._server_feats and 'MLST' in self._server_feats:
+            try:
+                resp = ftp.sendcmd(f'MLST {path}')
+            except ftplib.error_perm as e:
+                if str(e)[:3] in MISSING_PATH_CODES:
+                    return None
+                raise
+            
+            # Multi-line 250 reply; the fact line is " fact=value;... pathname"
+            lines = resp.splitlines()
+            fact_line = lines[1].strip() if len(lines) > 2 else ''
+            facts = {}
+            for fact in fact_line.split(' ', 1)[0].split(';'):
+                key, _, value = fact.partition('=')
+                facts[key.lower()] = value
+            
+            entry_type = facts.get('type', '').lower()
+            is_dir = entry_type in ('dir', 'cdir', 'pdir')
+            size = facts.get('size', '0')
+            modify = facts.get('modify')
+            mtime = _parse_ftp_time(modify) if modify else int(time.time())
+            return {
+                'st_mode': DIR_MODE if is_dir else FILE_MODE,
+                'st_nlink': 2 if is_dir else 1,
+                'st_size': 0 if is_dir or not size.isdigit() else int(size),
+                'st_ctime': mtime,
+                'st_mtime': mtime,
+                'st_atime': mtime
+            }
+        
+        try:
+            ftp.cwd(path)
+        except ftplib.error_perm:
+            return None  # Not a directory either
+        try:
+            ftp.cwd('/')
+        except ftplib.Error as e:
+            # Stranded in path - do not hand this connection back to the pool
+            raise ConnectionError(f"CWD / failed: {e}")
+        
+        mtime = int(time.time())
+        return {
+            'st_mode': DIR_MODE,
+            'st_nlink': 2,
+            'st_size': 0,
+            'st_ctime': mtime,
+            'st_mtime': mtime,
+            'st_atime': mtime
+        }
+    
+    def _start_retr(self, path: str, offset: int) -> Tuple[ftplib.FTP, socket.socket, int]:
+        """Start a RETR transfer, returning the file offset its data begins at"""
+        ftp = self._acquire()
         try:
-            ftp = self._get_ftp_connection()
+            ftp.voidcmd('TYPE I')
+            rest = offset if offset and self._rest_supported else None
+            try:
+                sock = ftp.transfercmd(f'RETR {path}', rest=rest)
+            except ftplib.error_perm as e:
+                # 500/502/504 - server has no REST, fall back to skipping
+                if rest is None or str(e)[:3] not in UNSUPPORTED_COMMAND_CODES:
+                    raise
+                self._rest_supported = False
+                rest = None
+                sock = ftp.transfercmd(f'RETR {path}')
             
-            # Use RETR command to download file
-            content = bytearray()
+            return ftp, sock, rest or 0
             
-            def store_data(data):
-                content.extend(data.encode('utf-8'))
+        except ftplib.error_perm:
+            self._release(ftp)
+            raise
+        except BaseException:
+            self._close_connection(ftp)
+            raise
+    
+    def _restart_read_stream(self, key: Tuple[str, int], stale: Optional[_Readahead],
+                             offset: int):
+        """Replace the stream for key with one starting at offset"""
+        evicted = []
+        with self._streams_lock:
+            # Another reader on this handle may have restarted it already
+            if self._read_streams.get(key) is stale:
+                if stale is not None:
+                    evicted.append(stale)
+                self._read_streams[key] = _Readahead(self, key[0], offset, self._ra_window)
+                self._read_streams.move_to_end(key)
+                while len(self._read_streams) > MAX_READ_STREAMS:
+                    evicted.append(self._read_streams.popitem(last=False)[1])
+        for old in evicted:
+            old.close()
+    
+    def _load_write_buffer(self, path: str, truncate: bool = False) -> bytearray:
+        """Return the write buffer for path, installing current file contents if
+        there is none. The RETR runs outside the path lock"""
+        buf = self._wbuf.get(path)
+        if buf is None:
+            if truncate:
+                buf = bytearray()
+            else:
+                # New files come through create(); a failed RETR here must fail
+                # the caller, not start an empty buffer that STOR would upload
+                with self._conn() as ftp:
+                    buf = self._retrieve(ftp, f'RETR {path}')
+        
+        with self._path_lock(path):
+            # A concurrent opener may have installed its copy first
+            return self._wbuf.setdefault(path, buf)
+    
+    def _upload(self, path: str):
+        """STOR the write buffer for path if it has unsaved changes
+        
+        The transfer runs outside the path lock; writers to path wait for it
+        instead, since the buffer cannot be resized while it is being sent.
+        """
+        lock = self._path_lock(path)
+        with lock:
+            self._wait_for_upload(path)
+            if path not in self._wbuf_dirty:
+                return
+            buf = self._wbuf[path]
+            self._wbuf_dirty.discard(path)
+            self._wbuf_uploading.add(path)
+        
+        try:
+            with self._conn() as ftp:
+                self._store(ftp, f'STOR {path}', buf)
+        except BaseException:
+            with lock:
+                self._wbuf_dirty.add(path)
+            raise
+        finally:
+            with lock:
+                self._wbuf_uploading.discard(path)
+                lock.notify_all()
+        
+        self._invalidate(path)
+    
+    def _open_for_write(self, path: str, truncate: bool) -> int:
+        """Allocate a write handle backed by the shared buffer for path"""
+        buf = self._load_write_buffer(path, truncate)
+        with self._path_lock(path):
+            # Re-install in case the last writer released it while we loaded
+            buf = self._wbuf.setdefault(path, buf)
+            if truncate:
+                self._wait_for_upload(path)
+                del buf[:]
+                self._wbuf_dirty.add(path)
             
-            ftp.retrbinary(f'RETR {path}', store_data)
-            ftp.quit()
+            fh = next(self._next_fh)
+            self._write_fhs[fh] = path
+            self._wbuf_refs[path] = self._wbuf_refs.get(path, 0) + 1
+            return fh
+    
+    def open(self, path: str, flags: int) -> int:
+        """Allocate a file handle and start prefetching readers' data"""
+        if flags & (os.O_WRONLY | os.O_RDWR):
+            try:
+                return self._open_for_write(path, bool(flags & os.O_TRUNC))
+            except ftplib.error_perm:
+                raise FuseOSError(errno.EACCES)
+            except Exception as e:
+                print(f"open error for {path}: {e}")
+                raise FuseOSError(errno.EIO)
+        
+        fh = next(self._next_fh)
+        self._restart_read_stream((path, fh), None, 0)
+        return fh
+    
+    def create(self, path: str, mode: int, fi=None) -> int:
+        """Create file - the empty upload happens on flush/release"""
+        return self._open_for_write(path, truncate=True)
+    
+    def read(self, path: str, size: int, offset: int, fh=None) -> bytes:
+        """Read file content"""
+        if path in self._wbuf:
+            # Unsaved writes must be visible to readers. The lock only covers
+            # the copy, so writers cannot resize the buffer under the view
+            with self._path_lock(path):
+                buf = self._wbuf.get(path)
+                if buf is not None:
+                    with memoryview(buf) as view:
+                        return bytes(view[offset:offset + size])
+        
+        key = (path, fh)
+        try:
+            # Serve sequential reads from the readahead window; anything the
+            # open transfer cannot reach restarts it at offset
+            for _ in range(2):
+                with self._streams_lock:
+                    stream = self._read_streams.get(key)
+                    if stream is not None:
+                        self._read_streams.move_to_end(key)
+                
+                if stream is not None:
+                    max_skip = self._ra_window if self._rest_supported else float('inf')
+                    data = stream.read(offset, size, max_skip)
+                    if data is not None:
+                        return data
+                
+                self._restart_read_stream(key, stream, offset)
             
-            # Apply offset and size
-            return bytes(content[offset:offset + size])
+            # More open files than MAX_READ_STREAMS keep evicting each other -
+            # use a one-off transfer that nothing else can close
+            stream = _Readahead(self, path, offset, size)
+            try:
+                return stream.read(offset, size, 0)
+            finally:
+                stream.close()
             
         except ftplib.error_perm as e:
             if '550' in str(e):
@@ -241,20 +1054,52 @@ class FtpFuseOperations(Operations):
             print(f"read error for {path}: {e}")
             raise FuseOSError(errno.EIO)
     
-    def write(self, path: str, data: bytes, offset: int, fh=None) -> int:
-        """Write file content"""
+    def flush(self, path: str, fh: int):
+        """Upload buffered writes"""
         try:
-            # For simplicity, this implementation overwrites the entire file
-            # A complete implementation would handle partial writes
+            self._upload(path)
+            return 0
             
-            ftp = self._get_ftp_connection()
-            
-            # Use STOR command to upload file
-            from io import BytesIO
-            data_stream = BytesIO(data)
-            
-            ftp.storbinary(f'STOR {path}', data_stream)
-            ftp.quit()
+        except ftplib.error_perm as e:
+            if '550' in str(e):
+                raise FuseOSError(errno.EACCES)
+            else:
+                raise FuseOSError(errno.EIO)
+        except Exception as e:
+            print(f"flush error for {path}: {e}")
+            raise FuseOSError(errno.EIO)
+    
+    def release(self, path: str, fh: int):
+        """Drop any transfer still open for this handle"""
+        with self._streams_lock:
+            stream = self._read_streams.pop((path, fh), None)
+        if stream is not None:
+            stream.close()
+        
+        if self._write_fhs.pop(fh, None) is not None:
+            try:
+                self.flush(path, fh)
+            finally:
+                with self._path_lock(path):
+                    # Last writer closed - stop serving this file from memory
+                    self._wbuf_refs[path] -= 1
+                    if not self._wbuf_refs[path]:
+                        del self._wbuf_refs[path]
+                        self._wbuf.pop(path, None)
+                        self._wbuf_dirty.discard(path)
+        return 0
+    
+    def write(self, path: str, data: bytes, offset: int, fh=None) -> int:
+        """Write file content into the buffer uploaded on flush/release"""
+        try:
+            buf = self._load_write_buffer(path)
+            with self._path_lock(path):
+                buf = self._wbuf.setdefault(path, buf)
+                self._wait_for_upload(path)
+                if offset > len(buf):
+                    buf.extend(bytes(offset - len(buf)))
+                buf[offset:offset + len(data)] = data
+                self._wbuf_dirty.add(path)
             
             return len(data)
             
@@ -268,16 +1113,47 @@ class FtpFuseOperations(Operations):
             raise FuseOSError(errno.EIO)
     
     def truncate(self, path: str, length: int, fh=None):
-        """Truncate file (simplified implementation)"""
-        # For monk-api integration, truncation would need special handling
-        pass
+        """Truncate file"""
+        try:
+            lock = self._path_lock(path)
+            buf = self._load_write_buffer(path, truncate=(length == 0))
+            with lock:
+                buf = self._wbuf.setdefault(path, buf)
+                self._wait_for_upload(path)
+                if length < len(buf):
+                    del buf[length:]
+                else:
+                    buf.extend(bytes(length - len(buf)))
+                self._wbuf_dirty.add(path)
+                buffered = path in self._wbuf_refs
+            
+            if not buffered:
+                # Truncate by path with no open handle - apply immediately
+                try:
+                    self._upload(path)
+                finally:
+                    with lock:
+                        if path not in self._wbuf_refs:
+                            self._wbuf.pop(path, None)
+                            self._wbuf_dirty.discard(path)
+            
+        except ftplib.error_perm as e:
+            if '550' in str(e):
+                raise FuseOSError(errno.EACCES)
+            else:
+                raise FuseOSError(errno.EIO)
+        except Exception as e:
+            print(f"truncate error for {path}: {e}")
+            raise FuseOSError(errno.EIO)
     
     def unlink(self, path: str):
         """Delete file"""
         try:
-            ftp = self._get_ftp_connection()
-            ftp.delete(path)
-            ftp.quit()
+            with self._conn() as ftp:
+                ftp.delete(path)
+            with self._path_lock(path):
+                self._wbuf_dirty.discard(path)
+            self._invalidate(path)
         except ftplib.error_perm as e:
             if '550' in str(e):
                 raise FuseOSError(errno.ENOENT)
@@ -286,16 +1162,59 @@ class FtpFuseOperations(Operations):
         except Exception as e:
             print(f"unlink error for {path}: {e}")
             raise FuseOSError(errno.EIO)
+    
+    def destroy(self, path: str):
+        """Close open transfers and pooled connections on unmount"""
+        if self._prefetch is not None:
+            self._prefetch.shutdown(wait=True)
+        
+        with self._streams_lock:
+            streams = list(self._read_streams.values())
+            self._read_streams.clear()
+        for stream in streams:
+            stream.close()
+        
+        while True:
+            try:
+                ftp, _ = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close_connection(ftp)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
 
 
 def main():
     """Mount FTP server as FUSE filesystem"""
-    if len(sys.argv) != 2:
-        print("Usage: python3 ftp-fuse-mount.py <mountpoint>")
-        print("Example: python3 ftp-fuse-mount.py /mnt/monk-api")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Mount monk-ftp server as FUSE filesystem",
+        epilog="Example: python3 ftp-fuse-mount.py /mnt/monk-api"
+    )
+    parser.add_argument('mountpoint')
+    parser.add_argument('--attr-timeout', type=float, default=5.0,
+                        help="seconds file attributes and directory listings are cached (default: 5)")
+    parser.add_argument('--entry-timeout', type=float, default=5.0,
+                        help="seconds the kernel caches name lookups (default: 5)")
+    parser.add_argument('--negative-timeout', type=float, default=1.0,
+                        help="seconds missing paths are cached (default: 1)")
+    parser.add_argument('--max-conns', type=_positive_int, default=4,
+                        help="FTP connections used for concurrent operations (default: 4)")
+    parser.add_argument('--prefetch-workers', type=int, default=0,
+                        help="parallel MDTM lookups per listing on servers without MLSD (default: 0, off)")
+    parser.add_argument('--tls', action='store_true',
+                        help="use explicit FTPS (AUTH TLS), resuming TLS sessions across connections")
+    args = parser.parse_args()
     
-    mountpoint = sys.argv[1]
+    mountpoint = args.mountpoint
     
     # Ensure mountpoint exists
     os.makedirs(mountpoint, exist_ok=True)
@@ -309,12 +1228,27 @@ def main():
     print()
     
     # Create FUSE filesystem
+    # Kernel caches use the same timeouts as the in-process caches; auto_cache
+    # keeps page cache across opens until the file's mtime changes
     fuse = FUSE(
-        FtpFuseOperations(),
+        FtpFuseOperations(
+            pool_size=args.max_conns,
+            prefetch_workers=args.prefetch_workers,
+            use_tls=args.tls,
+            attr_ttl=args.attr_timeout,
+            dir_ttl=args.attr_timeout,
+            negative_ttl=args.negative_timeout
+        ),
         mountpoint,
-        nothreads=True,
+        nothreads=False,
         foreground=True,
-        allow_other=False
+        allow_other=False,
+        attr_timeout=args.attr_timeout,
+        entry_timeout=args.entry_timeout,
+        negative_timeout=args.negative_timeout,
+        auto_cache=True,
+        big_writes=True,
+        max_read=TRANSFER_BLOCKSIZE
     )
 
 
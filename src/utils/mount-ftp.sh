@@ -2,9 +2,14 @@
 set -e
 
 # Mount monk-ftp server as FUSE filesystem
-# Usage: ./mount-ftp.sh [mountpoint]
+# Usage: ./mount-ftp.sh [mountpoint] [--attr-timeout N] [--entry-timeout N] [--negative-timeout N] [--max-conns N] [--prefetch-workers N] [--tls]
 
-MOUNTPOINT="${1:-/tmp/monk-ftp-mount}"
+# Mountpoint is optional, so only consume $1 when it is not a flag
+MOUNTPOINT="/tmp/monk-ftp-mount"
+if [[ $# -gt 0 && "$1" != -* ]]; then
+    MOUNTPOINT="$1"
+    shift
+fi
 SCRIPT_DIR="$(dirname "$0")"
 
 # Colors for output
@@ -46,4 +51,4 @@ print_info "Press Ctrl+C to unmount"
 
 # Mount filesystem (runs in foreground)
 cd "$SCRIPT_DIR/../.."
-python3 src/utils/ftp-fuse-mount.py "$MOUNTPOINT"
\ No newline at end of file
+python3 src/utils/ftp-fuse-mount.py "$MOUNTPOINT" "$@"
\ No newline at end of file